@@ -8,6 +8,7 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from typing_extensions import TypedDict
 import os
 from pathlib import Path
 
@@ -19,8 +20,16 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+
+class Activity(TypedDict):
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
+
+
 # In-memory activity database
-activities = {
+activities: dict[str, Activity] = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
@@ -86,8 +95,9 @@ def root():
     return RedirectResponse(url="/static/index.html")
 
 
+# The return type lets FastAPI serialize straight to JSON bytes via Pydantic
 @app.get("/activities")
-def get_activities():
+def get_activities() -> dict[str, Activity]:
     return activities
 
 
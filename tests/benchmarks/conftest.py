@@ -0,0 +1,13 @@
+"""
+Fixtures for the latency benchmarks
+"""
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Synchronous test client, since pytest-benchmark times plain callables"""
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,58 @@
+"""
+Latency benchmarks for the FastAPI endpoints
+
+Deselected by default; run with `pytest -m benchmark`. Don't combine this
+with `-n`, since pytest-benchmark disables itself under xdist.
+"""
+import asyncio
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from src.app import app
+from tests.helpers import BASKETBALL_SIGNUP, CHESS_SIGNUP, gather_bounded
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_get_activities(benchmark, client: TestClient):
+    """Benchmark getting all activities"""
+    response = benchmark(client.get, "/activities")
+    assert response.status_code == 200
+
+
+def test_signup(benchmark, client: TestClient):
+    """Benchmark signing up a new student"""
+    # Use a fresh email every round so each call takes the success path
+    emails = (f"perf_{i}@mergington.edu" for i in itertools.count())
+    
+    def signup():
+        return client.post(CHESS_SIGNUP, params={"email": next(emails)})
+    
+    response = benchmark(signup)
+    assert response.status_code == 200
+
+
+def test_multiple_concurrent_requests(benchmark):
+    """Benchmark a burst of concurrent signups"""
+    counter = itertools.count()
+    loop = asyncio.new_event_loop()
+    async_client = AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+    
+    async def burst():
+        return await gather_bounded(
+            async_client.post(
+                BASKETBALL_SIGNUP,
+                params={"email": f"concurrent_{next(counter)}@mergington.edu"},
+            )
+            for _ in range(10)
+        )
+    
+    try:
+        responses = benchmark(lambda: loop.run_until_complete(burst()))
+    finally:
+        loop.run_until_complete(async_client.aclose())
+        loop.close()
+    
+    assert all(r.status_code == 200 for r in responses)
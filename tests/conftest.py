@@ -1,15 +1,41 @@
 """
 Test configuration and fixtures for FastAPI tests
 """
+import pickle
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from src.app import app
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create a single in-memory ASGI client shared by the whole test session"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def baseline_activities(client):
+    """Activities as served at session start; tests must not mutate this"""
+    response = await client.get("/activities")
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def activities_by_spots_left(baseline_activities):
+    """Baseline (name, activity) pairs, fewest spots left first"""
+    return sorted(baseline_activities.items(),
+                  key=lambda kv: kv[1]["max_participants"] - len(kv[1]["participants"]))
+
+
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+def activities_view():
+    """Live, in-process reference to the app's activities; read it, don't write it"""
+    from src.app import get_activities
+    return get_activities()
 
 
 @pytest.fixture
@@ -31,16 +57,23 @@ def sample_activities():
     }
 
 
+@pytest.fixture(scope="session")
+def activities_snapshot():
+    """Pickled activities as they were at session start"""
+    from src.app import activities
+    return pickle.dumps(activities, protocol=5)
+
+
+# Under `pytest -n auto` each worker is its own process with its own copy of
+# the in-memory activities, so this only has to isolate tests within a worker.
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
+def reset_activities(activities_snapshot):
+    """Reset activities data after each test"""
     from src.app import activities
     
-    # Store original activities
-    original_activities = activities.copy()
-    
     yield
     
-    # Restore original activities after test
+    # Restore original activities after test; unpickling builds fresh
+    # participant lists, so mutations made by the test are discarded
     activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+    activities.update(pickle.loads(activities_snapshot))
@@ -0,0 +1,86 @@
+"""
+Shared helpers for the FastAPI tests
+"""
+import asyncio
+from functools import lru_cache
+from typing import Awaitable, Iterable
+from urllib.parse import quote
+
+from httpx import AsyncClient, Response
+from src.app import activities
+
+# Upper bound on requests in flight at once for concurrent tests
+MAX_CONCURRENCY = 50
+
+# Fields every activity must expose, and their expected types
+FIELD_TYPES = {
+    "description": str,
+    "schedule": str,
+    "max_participants": int,
+    "participants": list,
+}
+REQUIRED_FIELDS = frozenset(FIELD_TYPES)
+
+
+@lru_cache(maxsize=None)
+def _signup_url(activity: str) -> str:
+    """URL-encoded signup path for an activity"""
+    return f"/activities/{quote(activity, safe='')}/signup"
+
+
+@lru_cache(maxsize=None)
+def _unregister_url(activity: str) -> str:
+    """URL-encoded unregister path for an activity"""
+    return f"/activities/{quote(activity, safe='')}/unregister"
+
+
+# Signup and unregister paths for every seeded activity, built at import time
+ALL_SIGNUP_URLS: dict[str, str] = {name: _signup_url(name) for name in activities}
+ALL_UNREGISTER_URLS: dict[str, str] = {name: _unregister_url(name) for name in activities}
+
+CHESS_SIGNUP = ALL_SIGNUP_URLS["Chess Club"]
+CHESS_UNREGISTER = ALL_UNREGISTER_URLS["Chess Club"]
+BASKETBALL_SIGNUP = ALL_SIGNUP_URLS["Basketball Club"]
+
+
+def signup(client: AsyncClient, activity: str, email: str) -> Awaitable[Response]:
+    """Sign a student up for an activity"""
+    return client.post(f"{_signup_url(activity)}?email={quote(email)}")
+
+
+def unregister(client: AsyncClient, activity: str, email: str) -> Awaitable[Response]:
+    """Unregister a student from an activity"""
+    return client.delete(f"{_unregister_url(activity)}?email={quote(email)}")
+
+
+def validate_schema(activities: dict):
+    """Assert that every activity has all of the required fields, correctly typed"""
+    missing = [name for name, data in activities.items() if not REQUIRED_FIELDS.issubset(data)]
+    assert not missing, missing
+    
+    malformed = [
+        name for name, data in activities.items()
+        if not (isinstance(name, str) and name
+                and all(isinstance(data[field], kind) for field, kind in FIELD_TYPES.items())
+                and data["max_participants"] > 0)
+    ]
+    assert not malformed, malformed
+
+
+async def fetch_activities(client: AsyncClient) -> dict:
+    """Fetch the current activities and return the parsed JSON"""
+    response = await client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+async def gather_bounded(requests: Iterable[Awaitable[Response]],
+                         limit: int = MAX_CONCURRENCY) -> list[Response]:
+    """Await requests concurrently, keeping at most `limit` in flight"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(request: Awaitable[Response]) -> Response:
+        async with semaphore:
+            return await request
+    
+    return await asyncio.gather(*[bounded(request) for request in requests])